@@ -0,0 +1,43 @@
+"""
+Ahead-of-time compile the Numba kernels in main.py into the iss_kernels
+extension module, so the first prediction doesn't pay Numba's JIT startup.
+
+Run once before building the executable (requires Numba and a C compiler):
+
+    python build_kernels.py
+
+main.py imports iss_kernels when it is present and was built from the current
+KERNELS_VERSION, and falls back to the @njit versions (or plain NumPy) otherwise.
+Rebuild after changing a kernel.
+"""
+import os
+import sys
+
+from numba.pycc import CC
+
+# Build from the @njit definitions even if an older iss_kernels is importable
+sys.modules['iss_kernels'] = None
+import main
+
+cc = CC('iss_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Signatures must match what PassCalculator passes in: SGP4's (N x 3) TEME
+# positions, GMST angles and Sudbury's Earth-fixed position, all float64
+cc.export('slant_range_sq', 'f8[:](f8[:, :], f8[:], f8[:])')(main._slant_range_sq.py_func)
+cc.export('estimate_accuracy', 'Tuple((f8[:], i8[:]))(f8[:])')(main._estimate_accuracy.py_func)
+# Phase 2 reduction over the 1-second distance and altitude arrays
+cc.export('refine_window', 'Tuple((i8, f8, f8, i8))(f8[:], f8[:], f8)')(main._refine_window.py_func)
+
+# main.py only uses the build when this matches its KERNELS_VERSION
+KERNELS_VERSION = main.KERNELS_VERSION
+
+
+def kernels_version():
+    return KERNELS_VERSION
+
+
+cc.export('kernels_version', 'i8()')(kernels_version)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -1,10 +1,209 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
+import io
+import json
+import numpy as np
 import requests
 from skyfield.api import load, wgs84, EarthSatellite
+from skyfield.sgp4lib import theta_GMST1982
 import threading
-import pytz
+import queue
+import os
+import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from zoneinfo import ZoneInfo
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; fall back to plain NumPy
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Numba's on-disk cache needs the .py source next to the module, which a
+# frozen (PyInstaller) executable doesn't ship
+JIT_CACHE = not getattr(sys, 'frozen', False)
+
+try:
+    import iss_kernels  # Ahead-of-time compiled kernels, built by build_kernels.py
+except ImportError:
+    iss_kernels = None
+
+# Version of the kernel source compiled into iss_kernels; bump it whenever a
+# kernel or its signature changes so a stale build is ignored
+KERNELS_VERSION = 1
+if iss_kernels is not None and iss_kernels.kernels_version() != KERNELS_VERSION:
+    iss_kernels = None
+
+# Coarse grid samples evaluated per SGP4 call (30 days at 1-minute steps)
+COARSE_CHUNK_MINUTES = 30 * 1440
+
+# Phase 1 sampling interval before dropping to 1-minute steps
+COARSE_STEP_MINUTES = 5
+
+# Upper bound on how fast the Sudbury-ISS slant range can change
+# (~7.66 km/s orbital speed plus Earth's rotation, with headroom)
+ISS_MAX_RANGE_RATE_KM_S = 8.5
+
+# Orbit-plane pre-filter interval ahead of the 5-minute samples
+PLANE_STEP_MINUTES = 30
+
+# Upper bound on how fast Sudbury's distance to the ISS orbital plane can change
+# (~0.27 km/s from Earth's rotation carrying Sudbury across the plane, with headroom)
+ISS_MAX_PLANE_DRIFT_KM_S = 0.35
+
+# Parallel scan: one worker process per CPU, each sub-range running on past its
+# end by more than the longest possible pass window
+# (ProcessPoolExecutor on Windows accepts at most 61 workers)
+WORKER_PROCESSES = min(os.cpu_count() or 1, 61)
+CHUNK_OVERLAP_MINUTES = 60
+
+# CelesTrak ISS TLE, fetched over one kept-alive connection and revalidated
+# against the last response cached on disk
+TLE_URL = "https://celestrak.org/NORAD/elements/gp.php?CATNR=25544&FORMAT=TLE"
+TLE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".iss_cache", "tle_25544.json")
+SESSION = requests.Session()
+
+# Accuracy model: error grows linearly within each band of days from TLE epoch
+RELIABILITY_LEVELS = ("EXCELLENT", "VERY GOOD", "GOOD", "MODERATE", "POOR", "VERY POOR")
+_ACCURACY_BAND_ENDS = np.array([3.0, 7.0, 30.0, 90.0, 180.0])  # Upper bound of each band (days)
+_ACCURACY_BAND_STARTS = np.array([0.0, 3.0, 7.0, 30.0, 90.0, 180.0])
+_ACCURACY_BAND_SPANS = np.array([3.0, 4.0, 23.0, 60.0, 90.0, 180.0])
+_ACCURACY_ERROR_STARTS = np.array([1.0, 5.0, 20.0, 100.0, 500.0, 1000.0])
+_ACCURACY_ERROR_RISES = np.array([4.0, 15.0, 80.0, 400.0, 500.0, 1000.0])
+
+# Pass results are stored column-wise, one NumPy array per field. Times are
+# TT Julian dates and reliability holds indices into RELIABILITY_LEVELS
+PASS_FIELDS = ('start_jd', 'end_jd', 'closest_jd', 'min_distance', 'max_altitude',
+               'duration', 'error_km', 'reliability')
+
+
+def _empty_passes(n):
+    """Allocate the pass columns for up to n passes"""
+    passes = {field: np.empty(n) for field in PASS_FIELDS}
+    passes['reliability'] = np.empty(n, dtype=np.intp)
+    return passes
+
+
+def _load_tle_cache():
+    """Return the cached TLE response (text, ETag, Last-Modified), or None"""
+    try:
+        with open(TLE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) and cache.get('text') else None
+    except (OSError, ValueError):
+        return None
+
+
+def _save_tle_cache(response):
+    """Store a TLE response and its validators; the cache is best-effort"""
+    cache = {
+        'text': response.text,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+    }
+    try:
+        os.makedirs(os.path.dirname(TLE_CACHE_FILE), exist_ok=True)
+        with open(TLE_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+# Prefer the ahead-of-time compiled kernels when present: no JIT compile or
+# cache load on the first prediction, and nothing for Numba to set up at import
+if iss_kernels is not None:
+    _slant_range_sq = iss_kernels.slant_range_sq
+    _estimate_accuracy = iss_kernels.estimate_accuracy
+    _refine_window = iss_kernels.refine_window
+else:
+    @njit(cache=JIT_CACHE)
+    def _estimate_accuracy(days):
+        """
+        Vectorized error model for an array of days from TLE epoch.
+        Returns estimated error in kilometers and an index into RELIABILITY_LEVELS.
+        """
+        # Band lookup replaces the if/elif chain; beyond 180 days the last band
+        # keeps degrading linearly (1000 km more every 180 days)
+        level = np.searchsorted(_ACCURACY_BAND_ENDS, days)
+        error = (_ACCURACY_ERROR_STARTS[level]
+                 + (days - _ACCURACY_BAND_STARTS[level]) / _ACCURACY_BAND_SPANS[level]
+                 * _ACCURACY_ERROR_RISES[level])
+        return error, level
+
+
+    if NUMBA_AVAILABLE:
+        # contract/afn allow FMA and fast sin/cos but keep NaN semantics, so SGP4
+        # error samples (NaN positions) still compare as out of range
+        @njit(fastmath={'contract', 'afn'}, cache=JIT_CACHE)
+        def _slant_range_sq(r_teme, theta, observer_km):
+            """
+            Fused TEME -> Earth-fixed rotation, subtraction of Sudbury's position and
+            squared norm, in one pass without intermediate (N x 3) arrays.
+            """
+            n = r_teme.shape[0]
+            dist_sq = np.empty(n)
+            ox, oy, oz = observer_km[0], observer_km[1], observer_km[2]
+            for i in range(n):
+                cos_t = np.cos(theta[i])
+                sin_t = np.sin(theta[i])
+                x, y = r_teme[i, 0], r_teme[i, 1]
+                dx = cos_t * x + sin_t * y - ox
+                dy = cos_t * y - sin_t * x - oy
+                dz = r_teme[i, 2] - oz
+                dist_sq[i] = dx * dx + dy * dy + dz * dz
+            return dist_sq
+
+        @njit(cache=JIT_CACHE)
+        def _refine_window(dist_km, alt_deg, max_distance_km):
+            """
+            Closest approach index and distance, maximum altitude and seconds
+            within range for a 1-second Phase 2 window, in a single loop.
+            """
+            min_index = 0
+            min_distance = dist_km[0]
+            max_alt = alt_deg[0]
+            duration_sec = 0
+            for i in range(dist_km.shape[0]):
+                d = dist_km[i]
+                if d < min_distance:
+                    min_distance = d
+                    min_index = i
+                if alt_deg[i] > max_alt:
+                    max_alt = alt_deg[i]
+                if d <= max_distance_km:
+                    duration_sec += 1
+            return min_index, min_distance, max_alt, duration_sec
+    else:
+        def _slant_range_sq(r_teme, theta, observer_km):
+            """
+            TEME -> Earth-fixed rotation, subtraction of Sudbury's position and
+            squared norm, as NumPy array operations.
+            """
+            cos_t = np.cos(theta)
+            sin_t = np.sin(theta)
+            x, y, z = r_teme.T
+            dx = cos_t * x + sin_t * y - observer_km[0]
+            dy = cos_t * y - sin_t * x - observer_km[1]
+            dz = z - observer_km[2]
+            return dx * dx + dy * dy + dz * dz
+
+        def _refine_window(dist_km, alt_deg, max_distance_km):
+            """
+            Closest approach index and distance, maximum altitude and seconds
+            within range for a 1-second Phase 2 window, as NumPy reductions.
+            """
+            min_index = int(dist_km.argmin())
+            duration_sec = int((dist_km <= max_distance_km).sum())
+            return min_index, dist_km[min_index], alt_deg.max(), duration_sec
+
 
 class ISSPassPredictor:
     def __init__(self, root):
@@ -17,7 +216,19 @@ class ISSPassPredictor:
         self.longitude = -81
         self.location_name = "Sudbury, Ontario"
         self.max_distance_km = 1000
-        self.timezone = pytz.timezone('America/Toronto')  # Eastern Time
+        self.timezone = ZoneInfo('America/Toronto')  # Eastern Time
+        
+        # Skyfield objects reused across predictions
+        self.ts = load.timescale()
+        self.satellite = None
+        
+        # Worker processes for the pass calculation, started on first use and
+        # stopped when the window is closed
+        self.executor = None
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Widget updates posted by the prediction thread, applied on the Tk thread
+        self.ui_queue = queue.Queue()
         
         # TLE data
         self.tle_line1 = None
@@ -88,242 +299,150 @@ class ISSPassPredictor:
     def fetch_tle(self):
         """Fetch the latest ISS TLE data from CelesTrak"""
         try:
-            url = "https://celestrak.org/NORAD/elements/gp.php?CATNR=25544&FORMAT=TLE"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
+            # Conditional request: CelesTrak answers 304 with no body when the
+            # cached TLE is still current
+            cache = _load_tle_cache()
+            headers = {}
+            if cache is not None:
+                if cache.get('etag'):
+                    headers['If-None-Match'] = cache['etag']
+                if cache.get('last_modified'):
+                    headers['If-Modified-Since'] = cache['last_modified']
             
-            lines = response.text.strip().split('\n')
-            if len(lines) >= 3:
-                self.tle_line1 = lines[1].strip()
-                self.tle_line2 = lines[2].strip()
+            response = SESSION.get(TLE_URL, headers=headers, timeout=10)
+            not_modified = response.status_code == 304 and cache is not None
+            if not_modified:
+                text = cache['text']
+            else:
+                response.raise_for_status()
+                text = response.text
+            
+            lines = text.strip().split('\n')
+            if len(lines) >= 3 and lines[1].startswith('1 ') and lines[2].startswith('2 '):
+                tle_line1 = lines[1].strip()
+                tle_line2 = lines[2].strip()
                 
-                # Extract epoch from TLE
-                ts = load.timescale()
-                satellite = EarthSatellite(self.tle_line1, self.tle_line2, 'ISS', ts)
-                self.tle_epoch = satellite.epoch.utc_datetime()
+                # Only re-parse the TLE when CelesTrak has published a new one
+                if (self.satellite is None or tle_line1 != self.tle_line1
+                        or tle_line2 != self.tle_line2):
+                    self.tle_line1 = tle_line1
+                    self.tle_line2 = tle_line2
+                    self.satellite = EarthSatellite(self.tle_line1, self.tle_line2, 'ISS', self.ts)
+                    
+                    # Extract epoch from TLE
+                    self.tle_epoch = self.satellite.epoch.utc_datetime()
                 
+                # Only a response that parsed as a TLE replaces the cache
+                if not not_modified:
+                    _save_tle_cache(response)
                 return True
             else:
                 return False
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to fetch TLE data: {str(e)}")
+            # Runs on the prediction thread, so the dialog goes through the UI queue
+            message = f"Failed to fetch TLE data: {str(e)}"
+            self.ui_queue.put(lambda: messagebox.showerror("Error", message))
             return False
     
-    def estimate_accuracy(self, days_from_epoch):
-        """
-        Estimate prediction accuracy based on days from TLE epoch.
-        Returns estimated error in kilometers and reliability string.
-        """
-        if days_from_epoch <= 3:
-            error = 1 + (days_from_epoch / 3) * 4  # 1-5 km
-            reliability = "EXCELLENT"
-        elif days_from_epoch <= 7:
-            error = 5 + ((days_from_epoch - 3) / 4) * 15  # 5-20 km
-            reliability = "VERY GOOD"
-        elif days_from_epoch <= 30:
-            error = 20 + ((days_from_epoch - 7) / 23) * 80  # 20-100 km
-            reliability = "GOOD"
-        elif days_from_epoch <= 90:
-            error = 100 + ((days_from_epoch - 30) / 60) * 400  # 100-500 km
-            reliability = "MODERATE"
-        elif days_from_epoch <= 180:
-            error = 500 + ((days_from_epoch - 90) / 90) * 500  # 500-1000 km
-            reliability = "POOR"
-        else:
-            # Exponential degradation beyond 180 days
-            error = 1000 * (1 + (days_from_epoch - 180) / 180)
-            reliability = "VERY POOR"
-        
-        return error, reliability
-    
     def calculate_passes(self, years):
         """
-        Calculate ISS passes using a Coarse (1-min) then Fine (1-sec) search strategy.
-        Uses true slant-range distance via Skyfield's altaz() method.
+        Calculate ISS passes for the next `years` years, splitting the scan into
+        sub-ranges that run in parallel worker processes.
         """
-        ts = load.timescale()
-        satellite = EarthSatellite(self.tle_line1, self.tle_line2, 'ISS', ts)
-        location = wgs84.latlon(self.latitude, self.longitude)
-        
-        # Time range
-        start_time = ts.now()
-        end_time = ts.utc(start_time.utc_datetime() + timedelta(days=365*years))
-        
-        passes = []
-        
-        # PHASE 1: COARSE SEARCH - Check every 1 minute to find pass windows
-        current = start_time
-        step = timedelta(minutes=1)
-        
-        window_start = None
-        in_window = False
-        
-        end_dt = end_time.utc_datetime()
-        
-        while current.utc_datetime() < end_dt:
-            # Calculate geometric position relative to Sudbury
-            difference = satellite.at(current) - location.at(current)
-            alt, az, distance = difference.altaz()
-            
-            # Use true straight-line distance (slant range) in km
-            dist_km = distance.km
-            
-            # Check if within range
-            if dist_km <= self.max_distance_km:
-                if not in_window:
-                    in_window = True
-                    window_start = current
-            else:
-                if in_window:
-                    # Pass window just ended in coarse scan
-                    window_end = current
-                    
-                    # PHASE 2: FINE SEARCH - Zoom in with 1-second precision
-                    precise_pass = self.refine_pass_data(
-                        satellite, location, window_start, window_end, ts
-                    )
-                    
-                    if precise_pass:
-                        passes.append(precise_pass)
-                    
-                    in_window = False
-            
-            # Move forward 1 minute
-            current = ts.utc(current.utc_datetime() + step)
-            
-        return passes
-
-    def refine_pass_data(self, satellite, location, start_time, end_time, ts):
-        """
-        Phase 2: Scans an identified time window second-by-second 
-        to find exact pass details with high precision using vectorization.
-        """
-        # Add buffer to ensure we catch the true edges
-        t0 = start_time.utc_datetime() - timedelta(minutes=1)
-        t1 = end_time.utc_datetime() + timedelta(minutes=1)
-        
-        # Create time array with 1-second steps
-        duration_seconds = int((t1 - t0).total_seconds())
-        
-        # Build list of datetime objects at 1-second intervals
-        times_list = []
-        curr_t = t0
-        for _ in range(duration_seconds):
-            times_list.append(curr_t)
-            curr_t += timedelta(seconds=1)
-        
-        # Convert to Skyfield times (vectorized - all at once)
-        times = ts.from_datetimes(times_list)
-        
-        # Vectorized calculation - computes all positions simultaneously
-        difference = satellite.at(times) - location.at(times)
-        alts, azs, distances = difference.altaz()
-        
-        # Find index of minimum distance (closest approach)
-        dist_km_list = distances.km
-        min_dist_index = dist_km_list.argmin()
-        
-        min_distance = dist_km_list[min_dist_index]
-        
-        # If closest approach is still too far, ignore this pass
-        if min_distance > self.max_distance_km:
-            return None
-        
-        # Get maximum altitude during pass
-        max_alt = alts.degrees.max()
-        
-        # Get exact time of closest approach
-        closest_t = times[min_dist_index]
-        
-        # Calculate actual duration: count seconds where ISS is within range
-        duration_sec = sum(d <= self.max_distance_km for d in dist_km_list)
-        duration_mins = duration_sec / 60.0
-
-        # Calculate accuracy estimation
-        days_from_epoch = (closest_t.utc_datetime() - self.tle_epoch).total_seconds() / 86400
-        error_km, reliability = self.estimate_accuracy(days_from_epoch)
-        
-        return {
-            'start': start_time.utc_datetime(),
-            'end': end_time.utc_datetime(),
-            'closest_time': closest_t.utc_datetime(),
-            'min_distance': min_distance,
-            'max_altitude': max_alt,
-            'duration': duration_mins,
-            'error_km': error_km,
-            'reliability': reliability
-        }
+        start_time = self.ts.now()
+        minutes = int(365 * years * 1440)
+        
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=WORKER_PROCESSES)
+        
+        # One sub-range per worker, but no smaller than one SGP4 chunk
+        chunks = max(1, min(WORKER_PROCESSES, -(-minutes // COARSE_CHUNK_MINUTES)))
+        bounds = np.linspace(0, minutes, chunks + 1).astype(int)
+        
+        futures = [
+            self.executor.submit(
+                _calculate_pass_chunk, self.tle_line1, self.tle_line2,
+                self.latitude, self.longitude, self.max_distance_km,
+                start_time.tt, first, last, minutes
+            )
+            for first, last in zip(bounds[:-1], bounds[1:]) if last > first
+        ]
+        
+        # Sub-ranges come back in time order, so the columns just concatenate
+        results = [future.result() for future in futures]
+        if not results:
+            return _empty_passes(0)
+        return {field: np.concatenate([r[field] for r in results]) for field in PASS_FIELDS}
     
-    def format_datetime_et(self, dt_utc):
-        """Convert UTC datetime to Eastern Time with 12-hour format, handling DST"""
-        # Convert UTC to Eastern Time (automatically handles DST)
-        dt_et = dt_utc.replace(tzinfo=pytz.UTC).astimezone(self.timezone)
-        
-        # Format in 12-hour time
-        time_str = dt_et.strftime('%Y-%m-%d %I:%M:%S %p')
-        
-        # Get timezone abbreviation (EST or EDT)
-        tz_abbr = dt_et.strftime('%Z')
-        
-        return f"{time_str} {tz_abbr}"
+    def format_datetimes_et(self, dts_utc):
+        """Convert UTC datetimes to Eastern Time with 12-hour format, handling DST"""
+        # Convert UTC to Eastern Time (automatically handles DST) and format in
+        # 12-hour time with the timezone abbreviation (EST or EDT) in one strftime
+        utc = timezone.utc
+        tz = self.timezone
+        return [dt.replace(tzinfo=utc).astimezone(tz).strftime('%Y-%m-%d %I:%M:%S %p %Z')
+                for dt in dts_utc]
     
     def format_results(self, passes):
         """Format the prediction results for display"""
-        output = []
-        output.append("=" * 140)
-        output.append(f"ISS PASS PREDICTIONS FOR {self.location_name.upper()}")
+        buf = io.StringIO()
+        write = buf.write
+        write("=" * 140 + "\n")
+        write(f"ISS PASS PREDICTIONS FOR {self.location_name.upper()}\n")
         
         # Convert current time to ET
-        now_et = datetime.now(pytz.UTC).astimezone(self.timezone)
-        output.append(f"Generated: {now_et.strftime('%Y-%m-%d %I:%M:%S %p %Z')}")
+        now_et = datetime.now(timezone.utc).astimezone(self.timezone)
+        write(f"Generated: {now_et.strftime('%Y-%m-%d %I:%M:%S %p %Z')}\n")
         
         # Convert TLE epoch to ET
-        tle_epoch_et = self.tle_epoch.replace(tzinfo=pytz.UTC).astimezone(self.timezone)
-        output.append(f"TLE Epoch: {tle_epoch_et.strftime('%Y-%m-%d %I:%M:%S %p %Z')}")
-        
-        output.append(f"Total Passes Found: {len(passes)}")
-        output.append("=" * 140)
-        output.append("")
-        output.append(f"{'Pass #':<8} {'Date/Time (Eastern Time)':<30} {'Distance':<12} {'Max Alt':<10} {'Duration':<10} {'Est. Error':<15} {'Reliability':<15}")
-        output.append(f"{'':8} {'Closest Approach':<30} {'(km)':<12} {'(degrees)':<10} {'(min)':<10} {'(km)':<15} {'':<15}")
-        output.append("-" * 140)
-        
-        for i, p in enumerate(passes, 1):
-            date_str = self.format_datetime_et(p['closest_time'])
-            dist_str = f"{p['min_distance']:.2f}"
-            alt_str = f"{p['max_altitude']:.2f}"
-            dur_str = f"{p['duration']:.2f}"
-            error_str = f"±{p['error_km']:.0f}"
-            
-            output.append(f"{i:<8} {date_str:<30} {dist_str:<12} {alt_str:<10} {dur_str:<10} {error_str:<15} {p['reliability']:<15}")
-        
-        output.append("=" * 140)
-        output.append("")
-        output.append("CALCULATION METHODOLOGY:")
-        output.append("- Phase 1: Coarse scan using 1-minute steps to identify pass windows")
-        output.append("- Phase 2: Fine vectorized scan using 1-second steps within each window")
-        output.append("- Distance: True 3D slant range using Skyfield's altaz() method (NASA-grade spherical geometry)")
-        output.append("- Precision: Closest approach accurate to within ~7.66 km (ISS orbital speed × 1 second)")
-        output.append("- Duration: Actual seconds the ISS is within range (not just start-to-end approximation)")
-        output.append("- Performance: Vectorized calculations process entire pass windows simultaneously")
-        output.append("")
-        output.append("TIME ZONE NOTES:")
-        output.append("- All times are shown in Eastern Time (America/Toronto timezone)")
-        output.append("- Daylight Saving Time (EDT) is automatically applied when applicable (March-November)")
-        output.append("- Standard Time (EST) is used during winter months (November-March)")
-        output.append("")
-        output.append("ACCURACY NOTES:")
-        output.append("- EXCELLENT (Days 0-3): ±1-5 km - Highly accurate")
-        output.append("- VERY GOOD (Days 3-7): ±5-20 km - Very reliable")
-        output.append("- GOOD (Days 7-30): ±20-100 km - Generally reliable")
-        output.append("- MODERATE (Days 30-90): ±100-500 km - Use with caution")
-        output.append("- POOR (Days 90-180): ±500-1000 km - Low confidence")
-        output.append("- VERY POOR (Days 180+): ±1000+ km - Unreliable, for reference only")
-        output.append("")
-        output.append("NOTE: Predictions degrade due to atmospheric drag, orbital maneuvers, and space weather.")
-        output.append("For best accuracy, update TLE data regularly and regenerate predictions.")
-        
-        return "\n".join(output)
+        tle_epoch_et = self.tle_epoch.replace(tzinfo=timezone.utc).astimezone(self.timezone)
+        write(f"TLE Epoch: {tle_epoch_et.strftime('%Y-%m-%d %I:%M:%S %p %Z')}\n")
+        
+        pass_count = len(passes['closest_jd'])
+        write(f"Total Passes Found: {pass_count}\n")
+        write("=" * 140 + "\n")
+        write("\n")
+        write(f"{'Pass #':<8} {'Date/Time (Eastern Time)':<30} {'Distance':<12} {'Max Alt':<10} {'Duration':<10} {'Est. Error':<15} {'Reliability':<15}\n")
+        write(f"{'':8} {'Closest Approach':<30} {'(km)':<12} {'(degrees)':<10} {'(min)':<10} {'(km)':<15} {'':<15}\n")
+        write("-" * 140 + "\n")
+        
+        closest_times = self.ts.tt_jd(passes['closest_jd']).utc_datetime() if pass_count else []
+        date_strs = self.format_datetimes_et(closest_times)
+        
+        rows = zip(date_strs, passes['min_distance'].tolist(), passes['max_altitude'].tolist(),
+                   passes['duration'].tolist(), passes['error_km'].tolist(),
+                   passes['reliability'].tolist())
+        for i, (date_str, distance, altitude, duration, error_km, level) in enumerate(rows, 1):
+            write("%-8d %-30s %-12.2f %-10.2f %-10.2f ±%-14.0f %-15s\n" % (
+                i, date_str, distance, altitude, duration, error_km, RELIABILITY_LEVELS[level]))
+        
+        write("=" * 140 + "\n")
+        write("\n")
+        write("CALCULATION METHODOLOGY:\n")
+        write("- Phase 1: Orbit-plane filter every 30 minutes, then 5-minute and 1-minute steps near Sudbury, to identify pass windows\n")
+        write("- Phase 2: Fine vectorized scan using 1-second steps within each window\n")
+        write("- Distance: True 3D slant range from SGP4 positions in the Earth-fixed frame (Skyfield/sgp4)\n")
+        write("- Precision: Closest approach accurate to within ~7.66 km (ISS orbital speed × 1 second)\n")
+        write("- Duration: Actual seconds the ISS is within range (not just start-to-end approximation)\n")
+        write("- Performance: Vectorized calculations process entire pass windows simultaneously\n")
+        write("\n")
+        write("TIME ZONE NOTES:\n")
+        write("- All times are shown in Eastern Time (America/Toronto timezone)\n")
+        write("- Daylight Saving Time (EDT) is automatically applied when applicable (March-November)\n")
+        write("- Standard Time (EST) is used during winter months (November-March)\n")
+        write("\n")
+        write("ACCURACY NOTES:\n")
+        write("- EXCELLENT (Days 0-3): ±1-5 km - Highly accurate\n")
+        write("- VERY GOOD (Days 3-7): ±5-20 km - Very reliable\n")
+        write("- GOOD (Days 7-30): ±20-100 km - Generally reliable\n")
+        write("- MODERATE (Days 30-90): ±100-500 km - Use with caution\n")
+        write("- POOR (Days 90-180): ±500-1000 km - Low confidence\n")
+        write("- VERY POOR (Days 180+): ±1000+ km - Unreliable, for reference only\n")
+        write("\n")
+        write("NOTE: Predictions degrade due to atmospheric drag, orbital maneuvers, and space weather.\n")
+        write("For best accuracy, update TLE data regularly and regenerate predictions.")
+        
+        return buf.getvalue()
     
     def start_prediction(self):
         """Start the prediction process in a separate thread"""
@@ -339,44 +458,77 @@ class ISSPassPredictor:
         self.update_btn.config(state="disabled")
         self.progress.start()
         
-        thread = threading.Thread(target=self.run_prediction, args=(years,))
-        thread.daemon = True
-        thread.start()
+        # The thread only fetches the TLE and waits on the worker processes, so the
+        # Tk thread never competes with the number crunching for the GIL
+        self.prediction_thread = threading.Thread(target=self.run_prediction, args=(years,))
+        self.prediction_thread.daemon = True
+        self.prediction_thread.start()
+        self.root.after(100, self.poll_queue)
+    
+    def poll_queue(self):
+        """Apply widget updates posted by the prediction thread"""
+        while True:
+            try:
+                update = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            update()
+        
+        if self.prediction_thread.is_alive() or not self.ui_queue.empty():
+            self.root.after(100, self.poll_queue)
     
     def run_prediction(self, years):
         """Run the prediction calculation"""
-        self.status_label.config(text="Fetching latest TLE data from CelesTrak...")
+        ui = self.ui_queue.put
+        
+        ui(lambda: self.status_label.config(text="Fetching latest TLE data from CelesTrak..."))
         
         if not self.fetch_tle():
-            self.progress.stop()
-            self.update_btn.config(state="normal")
-            self.status_label.config(text="Failed to fetch TLE data.", fg="red")
+            ui(lambda: self.progress.stop())
+            ui(lambda: self.update_btn.config(state="normal"))
+            ui(lambda: self.status_label.config(text="Failed to fetch TLE data.", fg="red"))
             return
         
         # Update TLE info
-        tle_epoch_et = self.tle_epoch.replace(tzinfo=pytz.UTC).astimezone(self.timezone)
+        tle_epoch_et = self.tle_epoch.replace(tzinfo=timezone.utc).astimezone(self.timezone)
         tle_info = f"TLE Epoch: {tle_epoch_et.strftime('%Y-%m-%d %I:%M:%S %p %Z')}\n"
         tle_info += f"Line 1: {self.tle_line1}\n"
         tle_info += f"Line 2: {self.tle_line2}"
-        self.tle_info_label.config(text=tle_info)
+        ui(lambda: self.tle_info_label.config(text=tle_info))
         
-        self.status_label.config(text=f"Calculating passes for {years} year(s)... This may take a few minutes.")
+        ui(lambda: self.status_label.config(text=f"Calculating passes for {years} year(s)... This may take a few minutes."))
         
-        passes = self.calculate_passes(years)
+        try:
+            passes = self.calculate_passes(years)
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool) and self.executor is not None:
+                # A worker died and the pool can't take new work; start a fresh one next time
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+            message = f"Failed to calculate passes: {str(e)}"
+            ui(lambda: messagebox.showerror("Error", message))
+            ui(lambda: self.progress.stop())
+            ui(lambda: self.update_btn.config(state="normal"))
+            ui(lambda: self.status_label.config(text="Failed to calculate passes.", fg="red"))
+            return
+        pass_count = len(passes['closest_jd'])
         
-        self.status_label.config(text=f"Formatting results... Found {len(passes)} passes.")
+        ui(lambda: self.status_label.config(text=f"Formatting results... Found {pass_count} passes."))
         
         results = self.format_results(passes)
         
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(1.0, results)
-        
-        self.progress.stop()
-        self.update_btn.config(state="normal")
-        self.status_label.config(text=f"Complete! Found {len(passes)} passes over {years} year(s).", fg="green")
+        def show_results():
+            self.results_text.delete(1.0, tk.END)
+            self.results_text.insert(1.0, results)
+            
+            self.progress.stop()
+            self.update_btn.config(state="normal")
+            self.status_label.config(text=f"Complete! Found {pass_count} passes over {years} year(s).", fg="green")
+            
+            # Store results for export
+            self.last_results = results
         
-        # Store results for export
-        self.last_results = results
+        ui(show_results)
     
     def export_to_file(self):
         """Export results to a text file"""
@@ -392,8 +544,249 @@ class ISSPassPredictor:
             messagebox.showinfo("Success", f"Results exported to {filename}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export file: {str(e)}")
+    
+    def on_close(self):
+        """Stop any running pass calculation and close the window"""
+        if self.executor is not None:
+            # Python's exit handler would otherwise wait for the workers to finish
+            # their sub-ranges, leaving the program running with no window
+            processes = list((self.executor._processes or {}).values())
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            for process in processes:
+                process.terminate()
+            self.executor = None
+        self.root.destroy()
+
+
+class PassCalculator:
+    """
+    Pass-finding numerics for one TLE, kept free of Tk state so it can run
+    in a worker process.
+    """
+    def __init__(self, tle_line1, tle_line2, latitude, longitude, max_distance_km):
+        self.ts = load.timescale()
+        self.satellite = EarthSatellite(tle_line1, tle_line2, 'ISS', self.ts)
+        self.max_distance_km = max_distance_km
+        
+        # Sudbury is fixed in the Earth-fixed frame: precompute its position (km)
+        # and local "up" (geodetic normal) direction once
+        self.observer_km = wgs84.latlon(latitude, longitude).itrs_xyz.km
+        lat = np.radians(latitude)
+        lon = np.radians(longitude)
+        self.observer_up = np.array([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+    
+    def teme_state_km(self, times):
+        """
+        Return the ISS TEME position in km and velocity in km/s (both N x 3) and
+        the GMST angle at Skyfield times.
+        Runs the TLE's SGP4 model directly, skipping the precession-nutation
+        matrices that GCRS positions need.
+        """
+        # SGP4 expects UTC Julian dates, split into whole and fractional days
+        jd_ut1 = times.ut1
+        jd_utc = jd_ut1 - times.dut1 / 86400.0
+        jd_whole = np.floor(jd_utc)
+        error, r_teme, v_teme = self.satellite.model.sgp4_array(jd_whole, jd_utc - jd_whole)
+        
+        # TEME -> Earth-fixed is a rotation about the z-axis by GMST
+        theta, _ = theta_GMST1982(jd_ut1)
+        return r_teme, v_teme, theta
+    
+    def teme_position_km(self, times):
+        """
+        Return the ISS TEME position in km (N x 3) and the GMST angle at Skyfield times.
+        """
+        r_teme, v_teme, theta = self.teme_state_km(times)
+        return r_teme, theta
+    
+    def earth_fixed_position_km(self, times):
+        """
+        Return the ISS position in km in the Earth-fixed frame (3 x N) at Skyfield times.
+        """
+        r_teme, theta = self.teme_position_km(times)
+        cos_t = np.cos(theta)
+        sin_t = np.sin(theta)
+        x, y, z = r_teme.T
+        return np.array([cos_t * x + sin_t * y, cos_t * y - sin_t * x, z])
+    
+    def slant_range_sq(self, jd):
+        """
+        Return the squared slant range in km² from Sudbury to the ISS at each TT Julian date.
+        Works on raw SGP4 position vectors, skipping Skyfield's frame machinery and the sqrt.
+        """
+        dist_sq = np.empty(len(jd))
+        
+        # Evaluate in chunks so multi-year scans don't hold every
+        # intermediate position array in memory at once
+        for i in range(0, len(jd), COARSE_CHUNK_MINUTES):
+            times = self.ts.tt_jd(jd[i:i + COARSE_CHUNK_MINUTES])
+            
+            # Squared straight-line distance (slant range) in km²
+            r_teme, theta = self.teme_position_km(times)
+            dist_sq[i:i + COARSE_CHUNK_MINUTES] = _slant_range_sq(r_teme, theta, self.observer_km)
+        
+        return dist_sq
+    
+    def orbit_plane_distance_km(self, jd):
+        """
+        Return Sudbury's distance in km to the ISS orbital plane at each TT Julian date.
+        The ISS always lies in that plane, so this is a lower bound on the slant range.
+        """
+        r_teme, v_teme, theta = self.teme_state_km(self.ts.tt_jd(jd))
+        
+        # Orbit normal from the angular momentum direction, rotated to the Earth-fixed frame
+        normal = np.cross(r_teme, v_teme)
+        normal /= np.sqrt((normal * normal).sum(axis=1))[:, None]
+        cos_t = np.cos(theta)
+        sin_t = np.sin(theta)
+        nx, ny, nz = normal.T
+        ox, oy, oz = self.observer_km
+        return np.abs(ox * (cos_t * nx + sin_t * ny) + oy * (cos_t * ny - sin_t * nx) + oz * nz)
+    
+    def calculate_passes(self, jd_grid, keep_from=0, keep_until=None):
+        """
+        Calculate ISS passes using a Coarse (30-min orbit-plane filter, 5-min, then 1-min)
+        then Fine (1-sec) search strategy.
+        Uses true slant-range distance between the ISS and Sudbury.
+        jd_grid is the 1-minute grid of TT Julian dates to scan; only windows opening
+        at grid indices keep_from to keep_until are refined and returned.
+        """
+        minutes = len(jd_grid)
+        if minutes == 0:
+            return _empty_passes(0)
+        
+        # PHASE 1: COARSE SEARCH - Find pass windows on a 1-minute time grid
+        # Sample every 5 minutes first (plus the final minute, so every minute
+        # is at most half a step from a sample)
+        half_step = COARSE_STEP_MINUTES // 2
+        coarse_idx = np.unique(np.r_[np.arange(0, minutes, COARSE_STEP_MINUTES), minutes - 1])
+        
+        # Before that, rule out whole spans from Sudbury's distance to the orbital
+        # plane every 30 minutes: it bounds the slant range from below and drifts
+        # slowly, so a sample far enough from the plane clears every minute within
+        # reach of the 5-minute samples around it
+        plane_half = PLANE_STEP_MINUTES // 2
+        plane_idx = np.unique(np.r_[np.arange(0, minutes, PLANE_STEP_MINUTES), minutes - 1])
+        plane_km = self.orbit_plane_distance_km(jd_grid[plane_idx])
+        plane_margin_km = ISS_MAX_PLANE_DRIFT_KM_S * (plane_half + half_step) * 60
+        # NaN (SGP4 error) samples never rule a span out
+        open_idx = plane_idx[~(plane_km > self.max_distance_km + plane_margin_km)]
+        open_span = (open_idx[:, None] + np.arange(-plane_half, plane_half + 1)).ravel()
+        possible = np.zeros(minutes, dtype=bool)
+        possible[open_span[(open_span >= 0) & (open_span < minutes)]] = True
+        coarse_idx = coarse_idx[possible[coarse_idx]]
+        
+        coarse_sq = self.slant_range_sq(jd_grid[coarse_idx])
+        
+        # Slant range can't change faster than the ISS moves relative to Sudbury,
+        # so a minute can only be within range if its nearest 5-minute sample
+        # is within range plus that margin
+        # (compared squared, which is equivalent for non-negative distances)
+        max_d2 = self.max_distance_km ** 2
+        margin_km = ISS_MAX_RANGE_RATE_KM_S * half_step * 60
+        near = coarse_idx[coarse_sq <= (self.max_distance_km + margin_km) ** 2]
+        
+        # Minutes far from any candidate sample, or in a span ruled out by the
+        # orbit plane, are out of range by construction
+        dist_sq = np.full(minutes, np.inf)
+        dist_sq[coarse_idx] = coarse_sq
+        
+        # Drop to 1-minute steps around each candidate sample
+        fine_idx = (near[:, None] + np.arange(-half_step, half_step + 1)).ravel()
+        fine_idx = np.setdiff1d(fine_idx[(fine_idx >= 0) & (fine_idx < minutes)], coarse_idx)
+        dist_sq[fine_idx] = self.slant_range_sq(jd_grid[fine_idx])
+        
+        # Find window edges: a window starts where the ISS comes within range
+        # and ends at the first sample back out of range
+        mask = dist_sq <= max_d2
+        edges = np.diff(mask.astype(np.int8), prepend=0)
+        starts = np.where(edges == 1)[0]
+        ends = np.where(edges == -1)[0]
+        
+        # A window still open when the scan ends is dropped
+        windows = [(s, e) for s, e in zip(starts, ends)
+                   if s >= keep_from and (keep_until is None or s < keep_until)]
+        
+        # Every window yields at most one pass, so the columns can be sized up front
+        passes = _empty_passes(len(windows))
+        count = 0
+        for s, e in windows:
+            # PHASE 2: FINE SEARCH - Zoom in with 1-second precision
+            if self.refine_pass_data(jd_grid[s], jd_grid[e], passes, count):
+                count += 1
+        passes = {field: column[:count] for field, column in passes.items()}
+        
+        # Calculate accuracy estimation for every pass at once
+        days_from_epoch = passes['closest_jd'] - self.satellite.epoch.tt
+        passes['error_km'][:], passes['reliability'][:] = _estimate_accuracy(days_from_epoch)
+        
+        return passes
+
+    def refine_pass_data(self, start_jd, end_jd, passes, k):
+        """
+        Phase 2: Scans an identified time window second-by-second 
+        to find exact pass details with high precision using vectorization.
+        Stores the pass in row k of the pass columns and returns True if it is in range.
+        """
+        # Add buffer to ensure we catch the true edges
+        jd0 = start_jd - 1 / 1440.0
+        
+        # Create time array with 1-second steps
+        duration_seconds = int(round((end_jd - start_jd) * 86400)) + 120
+        jd = jd0 + np.arange(duration_seconds) / 86400.0
+        
+        # Build the Skyfield times directly from Julian dates (vectorized - all at once)
+        times = self.ts.tt_jd(jd)
+        
+        # Vectorized calculation - computes all positions simultaneously.
+        # Sudbury is fixed in the Earth-fixed frame, so only the ISS moves
+        topocentric = self.earth_fixed_position_km(times) - self.observer_km[:, None]
+        dist_km_list = np.sqrt((topocentric * topocentric).sum(axis=0))
+        
+        # Altitude above Sudbury's horizon
+        alt_deg = np.degrees(np.arcsin(self.observer_up @ topocentric / dist_km_list))
+        
+        # Closest approach, maximum altitude during the pass and the seconds
+        # the ISS is within range, all in one pass over the window
+        min_dist_index, min_distance, max_alt, duration_sec = _refine_window(
+            dist_km_list, alt_deg, self.max_distance_km)
+        
+        # If closest approach is still too far, ignore this pass
+        if min_distance > self.max_distance_km:
+            return False
+        
+        duration_mins = duration_sec / 60.0
+        
+        passes['start_jd'][k] = start_jd
+        passes['end_jd'][k] = end_jd
+        passes['closest_jd'][k] = jd[min_dist_index]  # Exact time of closest approach
+        passes['min_distance'][k] = min_distance
+        passes['max_altitude'][k] = max_alt
+        passes['duration'][k] = duration_mins
+        return True
+
+
+def _calculate_pass_chunk(tle_line1, tle_line2, latitude, longitude, max_distance_km,
+                          start_jd, first_minute, last_minute, total_minutes):
+    """
+    Worker-process entry point: find the passes whose windows open between
+    first_minute and last_minute of a total_minutes scan starting at start_jd.
+    """
+    calculator = PassCalculator(tle_line1, tle_line2, latitude, longitude, max_distance_km)
+    
+    # Start one minute early so a window opening at first_minute is seen opening,
+    # and run on past last_minute so windows opening near the end can close
+    scan_from = max(first_minute - 1, 0)
+    scan_to = min(last_minute + CHUNK_OVERLAP_MINUTES, total_minutes)
+    jd_grid = start_jd + np.arange(scan_from, scan_to) / 1440.0
+    
+    return calculator.calculate_passes(jd_grid, first_minute - scan_from, last_minute - scan_from)
+
 
 if __name__ == "__main__":
+    # Needed for the worker processes when running as a PyInstaller executable
+    multiprocessing.freeze_support()
+    
     root = tk.Tk()
     app = ISSPassPredictor(root)
     root.mainloop()
\ No newline at end of file